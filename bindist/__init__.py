@@ -15,9 +15,14 @@ Example usage:
     admin.upload_small_file("my-app", "1.0.0", "app.exe", file_bytes)
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .base import BaseClient, ApiResponse
-from .customer import CustomerClient
-from .admin import AdminClient
+
+if TYPE_CHECKING:
+    from .customer import CustomerClient
+    from .admin import AdminClient
 
 __version__ = "1.0.0"
 __all__ = [
@@ -26,3 +31,19 @@ __all__ = [
     "CustomerClient",
     "AdminClient",
 ]
+
+# Client modules are imported on first access (PEP 562), so a program that
+# only uses CustomerClient never loads the admin module and its imports.
+_LAZY_CLIENTS = {
+    "CustomerClient": ".customer",
+    "AdminClient": ".admin",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_CLIENTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
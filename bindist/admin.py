@@ -2,9 +2,54 @@
 
 import base64
 import hashlib
-from typing import Any
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, BinaryIO, Callable
 
-from .base import BaseClient, ApiResponse
+import requests
+
+from .base import BaseClient, ApiResponse, _json_dumps, _query_encoder
+
+# Prefer pybase64's SIMD encoder when the "fast" extra is installed.
+_b64encode: Callable[[memoryview], bytes]
+try:
+    import pybase64
+
+    _b64encode = pybase64.b64encode
+except ImportError:
+    _b64encode = base64.b64encode
+
+_encode_activity_query = _query_encoder("page", "pageSize", "type", "applicationId")
+_encode_customers_query = _query_encoder("page", "pageSize")
+
+# Read size used when hashing streamed uploads.
+HASH_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Defaults for multipart uploads of large files.
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_UPLOAD_WORKERS = 8
+
+
+def _sha256_stream(stream: BinaryIO) -> str:
+    """Compute the SHA256 hex digest of a stream from its current position."""
+    # hashlib.file_digest (Python 3.11+) reads into a reused buffer and hashes
+    # it without per-chunk copies. It hashes BytesIO objects from the start
+    # regardless of position, so those take the generic path.
+    if (
+        sys.version_info >= (3, 11)
+        and hasattr(stream, "readinto")
+        and not isinstance(stream, io.BytesIO)
+    ):
+        return hashlib.file_digest(stream, "sha256").hexdigest()
+
+    digest = hashlib.sha256()
+    while chunk := stream.read(HASH_CHUNK_SIZE):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 class AdminClient(BaseClient):
@@ -81,7 +126,7 @@ class AdminClient(BaseClient):
         application_id: str,
         version: str,
         file_name: str,
-        file_content: bytes,
+        file_content: bytes | bytearray | memoryview,
         release_notes: str | None = None,
     ) -> ApiResponse:
         """
@@ -91,7 +136,7 @@ class AdminClient(BaseClient):
             application_id: Application ID
             version: Version string (e.g., "1.0.0")
             file_name: Name of the file
-            file_content: File content as bytes
+            file_content: File content as a bytes-like object
             release_notes: Optional release notes
 
         Returns:
@@ -101,13 +146,23 @@ class AdminClient(BaseClient):
             "applicationId": application_id,
             "version": version,
             "fileName": file_name,
-            "fileContent": base64.b64encode(file_content).decode("utf-8"),
             "fileType": "MAIN",
         }
         if release_notes:
             payload["releaseNotes"] = release_notes
 
-        return self.post("/management/upload", json=payload)
+        # Splice the base64 bytes into the encoded JSON object rather than
+        # round-tripping them through str and the JSON encoder; base64 output
+        # never needs escaping.
+        body = b"".join(
+            (
+                _json_dumps(payload)[:-1],
+                b', "fileContent": "',
+                _b64encode(memoryview(file_content).cast("B")),
+                b'"}',
+            )
+        )
+        return self.post("/management/upload", data=body)
 
     def get_large_upload_url(
         self,
@@ -116,6 +171,7 @@ class AdminClient(BaseClient):
         file_name: str,
         file_size: int,
         content_type: str = "application/octet-stream",
+        part_size: int | None = None,
     ) -> ApiResponse:
         """
         Get a pre-signed URL for large file upload.
@@ -126,17 +182,22 @@ class AdminClient(BaseClient):
             file_name: Name of the file
             file_size: Size of the file in bytes
             content_type: MIME type of the file
+            part_size: If set, request a multipart upload with parts of
+                this many bytes
 
         Returns:
-            ApiResponse with uploadId and uploadUrl
+            ApiResponse with uploadId and uploadUrl, or uploadId and a
+            list of parts (partNumber, uploadUrl) for multipart uploads
         """
-        payload = {
+        payload: dict[str, Any] = {
             "applicationId": application_id,
             "version": version,
             "fileName": file_name,
             "fileSize": file_size,
             "contentType": content_type,
         }
+        if part_size:
+            payload["partSize"] = part_size
 
         return self.post("/management/upload/large-url", json=payload)
 
@@ -149,6 +210,7 @@ class AdminClient(BaseClient):
         file_size: int,
         checksum: str,
         release_notes: str | None = None,
+        parts: list[dict[str, Any]] | None = None,
     ) -> ApiResponse:
         """
         Complete a large file upload.
@@ -161,11 +223,12 @@ class AdminClient(BaseClient):
             file_size: Size of the file in bytes
             checksum: SHA256 checksum of the file
             release_notes: Optional release notes
+            parts: Uploaded parts (partNumber, etag) for multipart uploads
 
         Returns:
             ApiResponse with version details
         """
-        payload = {
+        payload: dict[str, Any] = {
             "uploadId": upload_id,
             "applicationId": application_id,
             "version": version,
@@ -175,6 +238,8 @@ class AdminClient(BaseClient):
         }
         if release_notes:
             payload["releaseNotes"] = release_notes
+        if parts:
+            payload["parts"] = parts
 
         return self.post("/management/upload/large-complete", json=payload)
 
@@ -183,52 +248,133 @@ class AdminClient(BaseClient):
         application_id: str,
         version: str,
         file_name: str,
-        file_content: bytes,
+        file_content: bytes | bytearray | memoryview | BinaryIO | os.PathLike[str],
         release_notes: str | None = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
     ) -> ApiResponse:
         """
         Upload a large file using multi-step process.
 
+        Paths and binary file objects are hashed in chunks and streamed to
+        S3, so the file never has to be held in memory. Files larger than
+        part_size are offered to the server as a multipart upload; if it
+        returns per-part URLs, the parts are uploaded concurrently.
+
         Args:
             application_id: Application ID
             version: Version string
             file_name: Name of the file
-            file_content: File content as bytes
+            file_content: File content as a bytes-like object, a binary file
+                object (read from its current position) or a path to the file
             release_notes: Optional release notes
+            part_size: Size of each part for multipart uploads
+            max_workers: Number of parts uploaded in parallel
 
         Returns:
             ApiResponse with version details
         """
-        file_size = len(file_content)
-        checksum = hashlib.sha256(file_content).hexdigest()
+        if isinstance(file_content, (bytes, bytearray, memoryview)):
+            # A flat byte view lets parts be sliced without copying.
+            view = memoryview(file_content).cast("B")
+            return self._upload_large(
+                application_id=application_id,
+                version=version,
+                file_name=file_name,
+                body=view,
+                file_size=view.nbytes,
+                compute_checksum=lambda: hashlib.sha256(view).hexdigest(),
+                release_notes=release_notes,
+                part_size=part_size,
+                max_workers=max_workers,
+            )
 
-        # Step 1: Get upload URL
-        url_response = self.get_large_upload_url(
-            application_id=application_id,
-            version=version,
-            file_name=file_name,
-            file_size=file_size,
-        )
+        with ExitStack() as stack:
+            stream: BinaryIO
+            if isinstance(file_content, os.PathLike):
+                stream = stack.enter_context(open(file_content, "rb"))
+            else:
+                stream = file_content
+
+            start = stream.tell()
+            file_size = stream.seek(0, os.SEEK_END) - start
+            stream.seek(start)
+
+            def compute_checksum() -> str:
+                checksum = _sha256_stream(stream)
+                stream.seek(start)
+                return checksum
+
+            return self._upload_large(
+                application_id=application_id,
+                version=version,
+                file_name=file_name,
+                body=stream,
+                file_size=file_size,
+                compute_checksum=compute_checksum,
+                release_notes=release_notes,
+                part_size=part_size,
+                max_workers=max_workers,
+            )
+
+    def _upload_large(
+        self,
+        application_id: str,
+        version: str,
+        file_name: str,
+        body: memoryview | BinaryIO,
+        file_size: int,
+        compute_checksum: Callable[[], str],
+        release_notes: str | None,
+        part_size: int,
+        max_workers: int,
+    ) -> ApiResponse:
+        """Run the upload URL / S3 PUT / complete sequence for a large file."""
+        # Step 1: Get upload URL(s), hashing the file while the request is
+        # in flight
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            url_future = executor.submit(
+                self.get_large_upload_url,
+                application_id=application_id,
+                version=version,
+                file_name=file_name,
+                file_size=file_size,
+                part_size=part_size if file_size > part_size else None,
+            )
+            checksum = compute_checksum()
+            url_response = url_future.result()
 
         if not url_response.success or url_response.data is None:
             return url_response
 
         upload_id: str = url_response.data["uploadId"]
-        upload_url: str = url_response.data["uploadUrl"]
-
-        # Step 2: Upload to S3
-        s3_response = self.put_binary(upload_url, file_content)
-        if s3_response.status_code != 200:
-            from .base import ApiResponse as AR
-
-            return AR(
-                success=False,
-                status_code=s3_response.status_code,
-                data=None,
-                error={"message": f"S3 upload failed: {s3_response.text}"},
-                meta=None,
-                raw={"error": s3_response.text},
-            )
+        parts: list[dict[str, Any]] | None = url_response.data.get("parts")
+
+        # Step 2: Upload to S3, in parallel parts if the server asked for it
+        if parts:
+            part_size = url_response.data.get("partSize", part_size)
+            s3_responses = self._upload_parts(parts, body, part_size, max_workers)
+        else:
+            upload_url: str = url_response.data["uploadUrl"]
+            s3_responses = [self.put_binary(upload_url, body)]
+
+        for s3_response in s3_responses:
+            if s3_response.status_code != 200:
+                return ApiResponse(
+                    success=False,
+                    status_code=s3_response.status_code,
+                    data=None,
+                    error={"message": f"S3 upload failed: {s3_response.text}"},
+                    meta=None,
+                    raw={"error": s3_response.text},
+                )
+
+        completed_parts = None
+        if parts:
+            completed_parts = [
+                {"partNumber": part["partNumber"], "etag": r.headers.get("ETag")}
+                for part, r in zip(parts, s3_responses)
+            ]
 
         # Step 3: Complete upload
         return self.complete_large_upload(
@@ -239,8 +385,41 @@ class AdminClient(BaseClient):
             file_size=file_size,
             checksum=checksum,
             release_notes=release_notes,
+            parts=completed_parts,
         )
 
+    def _upload_parts(
+        self,
+        parts: list[dict[str, Any]],
+        body: memoryview | BinaryIO,
+        part_size: int,
+        max_workers: int,
+    ) -> list[requests.Response]:
+        """PUT each part of body to its pre-signed URL concurrently."""
+        read_part: Callable[[int], bytes | memoryview]
+        if isinstance(body, memoryview):
+            view = body
+
+            def read_part(offset: int) -> bytes | memoryview:
+                return view[offset : offset + part_size]
+
+        else:
+            stream = body
+            start = stream.tell()
+            lock = threading.Lock()
+
+            def read_part(offset: int) -> bytes | memoryview:
+                with lock:
+                    stream.seek(start + offset)
+                    return stream.read(part_size)
+
+        def upload(part: dict[str, Any]) -> requests.Response:
+            offset = (part["partNumber"] - 1) * part_size
+            return self.put_binary(part["uploadUrl"], read_part(offset))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(upload, parts))
+
     def update_version(
         self,
         application_id: str,
@@ -338,15 +517,12 @@ class AdminClient(BaseClient):
         Returns:
             ApiResponse with activity list
         """
-        params: dict[str, Any] = {
-            "page": page,
-            "pageSize": page_size,
-        }
-        if activity_type:
-            params["type"] = activity_type
-        if application_id:
-            params["applicationId"] = application_id
-
+        params = _encode_activity_query(
+            page,
+            page_size,
+            activity_type or None,
+            application_id or None,
+        )
         return self.get("/activity", params=params)
 
     def list_customers(
@@ -364,8 +540,5 @@ class AdminClient(BaseClient):
         Returns:
             ApiResponse with customers list
         """
-        params = {
-            "page": page,
-            "pageSize": page_size,
-        }
+        params = _encode_customers_query(page, page_size)
         return self.get("/management/customers", params=params)
@@ -0,0 +1,248 @@
+"""
+Async API clients built on httpx.
+
+Requires the "async" extra (``pip install bindist[async]``).
+"""
+
+import asyncio
+import sys
+from types import TracebackType
+from typing import Any, TypeVar
+
+import httpx
+
+from .base import ApiResponse
+
+_ClientT = TypeVar("_ClientT", bound="AsyncBaseClient")
+
+
+def set_fast_event_loop() -> bool:
+    """
+    Install a faster asyncio event loop policy if one is available.
+
+    Tries uringcore (io_uring, Linux only), then uvloop. Neither is a
+    dependency of this package; install one to opt in. Call this once at
+    start-up, before any event loop is created.
+
+    Returns:
+        True if a faster event loop policy was installed
+    """
+    if sys.platform == "linux":
+        try:
+            import uringcore
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+            return True
+
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class AsyncBaseClient:
+    """Async HTTP client with authentication support."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        max_connections: int = 100,
+    ):
+        """
+        Initialize the async client.
+
+        Args:
+            base_url: API base URL (e.g., https://api.bindist.eu)
+            api_key: API key in format {tenant_id}.{secret}
+            max_connections: Maximum number of pooled connections
+        """
+        self.base_url = base_url.rstrip("/")
+        self._api_root = f"{self.base_url}/v1"
+        self.api_key = api_key
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=30.0,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+        )
+
+    async def __aenter__(self: _ClientT) -> _ClientT:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self.session.aclose()
+
+    def _url(self, path: str) -> str:
+        """Build full URL from path."""
+        return self._api_root + path
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        """Make GET request."""
+        response = await self.session.get(
+            self._url(path),
+            params=params,
+            headers=headers,
+        )
+        return ApiResponse.from_response(response)
+
+    async def post(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        """Make POST request."""
+        response = await self.session.post(
+            self._url(path),
+            json=json,
+            headers=headers,
+        )
+        return ApiResponse.from_response(response)
+
+    async def patch(
+        self,
+        path: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        """Make PATCH request."""
+        response = await self.session.patch(
+            self._url(path),
+            json=json,
+            headers=headers,
+        )
+        return ApiResponse.from_response(response)
+
+    async def delete(
+        self,
+        path: str,
+        headers: dict[str, str] | None = None,
+    ) -> ApiResponse:
+        """Make DELETE request."""
+        response = await self.session.delete(
+            self._url(path),
+            headers=headers,
+        )
+        return ApiResponse.from_response(response)
+
+
+class AsyncAdminClient(AsyncBaseClient):
+    """
+    Async client for admin/management API endpoints.
+
+    Use this client to run many independent management calls concurrently,
+    e.g. provisioning customers in bulk.
+    """
+
+    async def create_customer(
+        self,
+        name: str,
+        parent_customer_id: str = "admin",
+        notes: str | None = None,
+    ) -> ApiResponse:
+        """
+        Create a new customer with an API key.
+
+        Args:
+            name: Customer display name
+            parent_customer_id: Parent customer ID (default: admin)
+            notes: Optional customer notes
+
+        Returns:
+            ApiResponse with customer details and API key
+        """
+        payload: dict[str, Any] = {
+            "name": name,
+        }
+        if notes:
+            payload["notes"] = notes
+
+        return await self.post(
+            f"/management/customers/{parent_customer_id}/apikeys",
+            json=payload,
+        )
+
+    async def create_customers_bulk(
+        self,
+        customers: list[dict[str, Any]],
+    ) -> list[ApiResponse]:
+        """
+        Create several customers concurrently.
+
+        Args:
+            customers: Keyword arguments for create_customer, one dict
+                per customer
+
+        Returns:
+            List of ApiResponse in the same order as customers
+        """
+        return list(
+            await asyncio.gather(*(self.create_customer(**c) for c in customers))
+        )
+
+    async def update_customer(
+        self,
+        customer_id: str,
+        name: str | None = None,
+        is_active: bool | None = None,
+        notes: str | None = None,
+    ) -> ApiResponse:
+        """
+        Update customer metadata.
+
+        Args:
+            customer_id: Customer ID
+            name: New display name
+            is_active: Enable/disable customer
+            notes: Update notes
+
+        Returns:
+            ApiResponse with updated customer details
+        """
+        payload: dict[str, Any] = {}
+        if name is not None:
+            payload["name"] = name
+        if is_active is not None:
+            payload["isActive"] = is_active
+        if notes is not None:
+            payload["notes"] = notes
+
+        return await self.patch(
+            f"/management/customers/{customer_id}",
+            json=payload,
+        )
+
+    async def delete_application(self, application_id: str) -> ApiResponse:
+        """
+        Soft-delete an application.
+
+        Args:
+            application_id: Application ID to delete
+
+        Returns:
+            ApiResponse with deletion status
+        """
+        return await self.delete(f"/management/applications/{application_id}")
@@ -1,12 +1,106 @@
 """Base HTTP client with authentication."""
 
-from typing import Any
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Any, BinaryIO, Callable, Iterable, Protocol, TypeVar
+from urllib.parse import quote_plus
 
 import requests
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# Chunk size used when streaming downloads.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-@dataclass
+# Defaults for parallel ranged downloads.
+DEFAULT_RANGE_SIZE = 8 * 1024 * 1024
+DEFAULT_DOWNLOAD_WORKERS = 8
+
+# Default number of concurrent calls made by BaseClient.bulk.
+DEFAULT_BULK_WORKERS = 16
+
+_T = TypeVar("_T")
+
+
+def _query_encoder(*keys: str) -> Callable[..., str]:
+    """
+    Build a query-string encoder for a fixed list of parameter names.
+
+    The encoder takes one value per key, in order, and skips None values.
+    Its output matches urlencode() without building a params dict per call.
+    """
+
+    def encode(*values: Any) -> str:
+        return "&".join(
+            f"{key}={quote_plus(str(value))}"
+            for key, value in zip(keys, values)
+            if value is not None
+        )
+
+    return encode
+
+
+def _http_adapter() -> HTTPAdapter:
+    """
+    Create a connection-pooling adapter with retries.
+
+    The pool is large enough for bulk() and parallel transfers. Idempotent
+    requests are retried with backoff on connection errors, 429 and 5xx.
+    """
+    return HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+# Prefer orjson, which encodes straight to bytes, when the "fast" extra is
+# installed.
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+
+class HttpResponse(Protocol):
+    """Minimal response interface shared by requests and httpx."""
+
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def text(self) -> str: ...
+
+
+class Hasher(Protocol):
+    """Incremental hash object, e.g. hashlib.sha256()."""
+
+    def update(self, data: bytes, /) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
 class ApiResponse:
     """Wrapper for API responses."""
 
@@ -18,11 +112,23 @@ class ApiResponse:
     raw: dict[str, Any]
 
     @classmethod
-    def from_response(cls, response: requests.Response) -> "ApiResponse":
-        """Create ApiResponse from requests.Response."""
+    def from_response(cls, response: HttpResponse) -> "ApiResponse":
+        """Create ApiResponse from a requests or httpx response."""
+        # Successful responses without a body (e.g. 204 No Content) skip
+        # the JSON decode, which would otherwise fail and raise.
+        if not response.content and 200 <= response.status_code < 300:
+            return cls(
+                success=True,
+                status_code=response.status_code,
+                data=None,
+                error=None,
+                meta=None,
+                raw={},
+            )
+
         try:
-            json_data = response.json()
-        except requests.exceptions.JSONDecodeError:
+            json_data = _json_loads(response.content)
+        except ValueError:
             json_data = {"success": False, "error": {"message": response.text}}
 
         return cls(
@@ -47,6 +153,7 @@ class BaseClient:
             api_key: API key in format {tenant_id}.{secret}
         """
         self.base_url = base_url.rstrip("/")
+        self._api_root = f"{self.base_url}/v1"
         self.api_key = api_key
         self.session = requests.Session()
         self.session.headers.update(
@@ -55,15 +162,25 @@ class BaseClient:
                 "Content-Type": "application/json",
             }
         )
+        adapter = _http_adapter()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Unauthenticated session for pre-signed S3 URLs, kept so that
+        # connections to the storage host are reused across transfers.
+        self._s3_session = requests.Session()
+        s3_adapter = _http_adapter()
+        self._s3_session.mount("https://", s3_adapter)
+        self._s3_session.mount("http://", s3_adapter)
 
     def _url(self, path: str) -> str:
         """Build full URL from path."""
-        return f"{self.base_url}/v1{path}"
+        return self._api_root + path
 
     def get(
         self,
         path: str,
-        params: dict[str, Any] | None = None,
+        params: dict[str, Any] | str | None = None,
         headers: dict[str, str] | None = None,
     ) -> ApiResponse:
         """Make GET request."""
@@ -79,11 +196,14 @@ class BaseClient:
         path: str,
         json: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
+        data: bytes | None = None,
     ) -> ApiResponse:
-        """Make POST request."""
+        """Make POST request with a JSON payload or a pre-encoded JSON body."""
+        if json is not None:
+            data = _json_dumps(json)
         response = self.session.post(
             self._url(path),
-            json=json,
+            data=data,
             headers=headers,
         )
         return ApiResponse.from_response(response)
@@ -97,7 +217,7 @@ class BaseClient:
         """Make PATCH request."""
         response = self.session.patch(
             self._url(path),
-            json=json,
+            data=None if json is None else _json_dumps(json),
             headers=headers,
         )
         return ApiResponse.from_response(response)
@@ -114,20 +234,50 @@ class BaseClient:
         )
         return ApiResponse.from_response(response)
 
+    def bulk(
+        self,
+        fn: Callable[..., _T],
+        kwargs_list: Iterable[dict[str, Any]],
+        max_workers: int = DEFAULT_BULK_WORKERS,
+    ) -> list[_T]:
+        """
+        Call a client method once per set of keyword arguments, concurrently.
+
+        Example:
+            admin.bulk(
+                admin.delete_application,
+                [{"application_id": app_id} for app_id in app_ids],
+            )
+
+        Args:
+            fn: Method to call, e.g. admin.update_customer
+            kwargs_list: Keyword arguments for each call
+            max_workers: Maximum number of calls in flight
+
+        Returns:
+            Results in the same order as kwargs_list
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda kwargs: fn(**kwargs), kwargs_list))
+
     def put_binary(
         self,
         url: str,
-        data: bytes,
+        data: bytes | memoryview | BinaryIO,
         content_type: str = "application/octet-stream",
     ) -> requests.Response:
         """
         Upload binary data to a URL (for S3 pre-signed uploads).
 
+        File objects are streamed from their current position rather than
+        read into memory.
+
         Note: This doesn't use the session headers since it's for S3.
         """
-        return requests.put(
+        return self._s3_session.put(
             url,
-            data=data,
+            # urllib3 sends buffer objects as-is; the stubs only list bytes.
+            data=data,  # type: ignore[arg-type]
             headers={"Content-Type": content_type},
         )
 
@@ -137,6 +287,110 @@ class BaseClient:
 
         Note: This doesn't use the session headers since it's for S3.
         """
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.content
+        buffer = io.BytesIO()
+        self.download_stream(url, buffer)
+        return buffer.getvalue()
+
+    def download_stream(
+        self,
+        url: str,
+        dest: BinaryIO | os.PathLike[str],
+        hasher: Hasher | None = None,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream a file from URL to dest (for S3 pre-signed downloads).
+
+        Only one chunk is held in memory at a time.
+
+        Args:
+            url: Pre-signed download URL
+            dest: Binary file object or path to write to
+            hasher: Optional hash object updated with every chunk
+            chunk_size: Bytes read per chunk
+
+        Returns:
+            Number of bytes written
+
+        Note: This doesn't use the session headers since it's for S3.
+        """
+        with ExitStack() as stack:
+            response = stack.enter_context(self._s3_session.get(url, stream=True))
+            response.raise_for_status()
+
+            out: BinaryIO
+            if isinstance(dest, os.PathLike):
+                out = stack.enter_context(open(dest, "wb"))
+            else:
+                out = dest
+
+            size = 0
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if hasher is not None:
+                    hasher.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+
+        return size
+
+    def download_parallel(
+        self,
+        url: str,
+        part_size: int = DEFAULT_RANGE_SIZE,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+    ) -> bytes:
+        """
+        Download file from URL as concurrent byte ranges (for S3 pre-signed
+        downloads).
+
+        The first range request also reports the total size. If the server
+        ignores the Range header, its full response is returned as is. The
+        ranges are assembled in one preallocated buffer.
+
+        Args:
+            url: Pre-signed download URL
+            part_size: Bytes fetched per range request
+            max_workers: Maximum number of range requests in flight
+
+        Returns:
+            File content as bytes
+
+        Note: This doesn't use the session headers since it's for S3.
+        """
+        first = self._s3_session.get(url, headers={"Range": f"bytes=0-{part_size - 1}"})
+        if first.status_code == 416:
+            # Range not satisfiable: the object is empty
+            return b""
+        first.raise_for_status()
+        if first.status_code != 206:
+            return first.content
+
+        total = int(first.headers["Content-Range"].rsplit("/", 1)[1])
+        buffer = bytearray(total)
+        view = memoryview(buffer)
+        view[: len(first.content)] = first.content
+
+        def fetch(offset: int) -> None:
+            end = min(offset + part_size, total)
+            with self._s3_session.get(
+                url,
+                headers={"Range": f"bytes={offset}-{end - 1}"},
+                stream=True,
+            ) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise IOError(f"Range request ignored for bytes {offset}-{end - 1}")
+                position = offset
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    view[position : position + len(chunk)] = chunk
+                    position += len(chunk)
+            if position != end:
+                raise IOError(
+                    f"Incomplete range: expected {end - offset} bytes, "
+                    f"got {position - offset}"
+                )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fetch, range(len(first.content), total, part_size)))
+
+        return bytes(buffer)
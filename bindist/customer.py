@@ -1,9 +1,19 @@
 """Customer API client for end-users."""
 
 import hashlib
-from typing import Any
+import io
+import os
+from typing import Any, BinaryIO
 
-from .base import BaseClient, ApiResponse
+from .base import BaseClient, ApiResponse, _query_encoder
+
+_encode_applications_query = _query_encoder("page", "pageSize", "search", "tags")
+
+
+def _verify_checksum(expected: str, actual: str) -> None:
+    """Raise ValueError if a downloaded file's SHA256 does not match."""
+    if actual != expected:
+        raise ValueError(f"Checksum mismatch: expected {expected}, got {actual}")
 
 
 class CustomerClient(BaseClient):
@@ -33,15 +43,12 @@ class CustomerClient(BaseClient):
         Returns:
             ApiResponse with applications list
         """
-        params: dict[str, Any] = {
-            "page": page,
-            "pageSize": page_size,
-        }
-        if search:
-            params["search"] = search
-        if tags:
-            params["tags"] = ",".join(tags)
-
+        params = _encode_applications_query(
+            page,
+            page_size,
+            search or None,
+            ",".join(tags) if tags else None,
+        )
         return self.get("/applications", params=params)
 
     def get_application(self, application_id: str) -> ApiResponse:
@@ -147,6 +154,7 @@ class CustomerClient(BaseClient):
         file_id: str | None = None,
         test_channel: bool = False,
         verify_checksum: bool = True,
+        max_workers: int = 1,
     ) -> tuple[bytes, dict[str, Any]]:
         """
         Download a file and optionally verify checksum.
@@ -157,6 +165,8 @@ class CustomerClient(BaseClient):
             file_id: Optional file ID for multi-file versions
             test_channel: If True, allow downloading disabled versions
             verify_checksum: If True, verify SHA256 checksum
+            max_workers: If greater than 1, download the file as this many
+                concurrent byte ranges
 
         Returns:
             Tuple of (file_content, metadata_dict)
@@ -165,6 +175,80 @@ class CustomerClient(BaseClient):
             ValueError: If checksum verification fails
             Exception: If download URL request fails
         """
+        if max_workers <= 1:
+            buffer = io.BytesIO()
+            metadata = self.download_file_to(
+                application_id=application_id,
+                version=version,
+                dest=buffer,
+                file_id=file_id,
+                test_channel=test_channel,
+                verify_checksum=verify_checksum,
+            )
+            return buffer.getvalue(), metadata
+
+        download_url, metadata = self._resolve_download(
+            application_id, version, file_id, test_channel
+        )
+        content = self.download_parallel(download_url, max_workers=max_workers)
+
+        if verify_checksum and metadata["checksum"]:
+            _verify_checksum(metadata["checksum"], hashlib.sha256(content).hexdigest())
+
+        return content, metadata
+
+    def download_file_to(
+        self,
+        application_id: str,
+        version: str,
+        dest: BinaryIO | os.PathLike[str],
+        file_id: str | None = None,
+        test_channel: bool = False,
+        verify_checksum: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Stream a file to disk and optionally verify checksum.
+
+        The checksum is computed while the file is written, so large files
+        are never held in memory.
+
+        Args:
+            application_id: Application ID
+            version: Version string
+            dest: Binary file object or path to write to
+            file_id: Optional file ID for multi-file versions
+            test_channel: If True, allow downloading disabled versions
+            verify_checksum: If True, verify SHA256 checksum
+
+        Returns:
+            Metadata dict (fileName, fileSize, checksum, expiresAt)
+
+        Raises:
+            ValueError: If checksum verification fails (dest is left with
+                the downloaded content)
+            Exception: If download URL request fails
+        """
+        download_url, metadata = self._resolve_download(
+            application_id, version, file_id, test_channel
+        )
+
+        expected_checksum = metadata["checksum"]
+        hasher = hashlib.sha256() if verify_checksum and expected_checksum else None
+        self.download_stream(download_url, dest, hasher=hasher)
+
+        if hasher is not None:
+            _verify_checksum(expected_checksum, hasher.hexdigest())
+
+        return metadata
+
+    def _resolve_download(
+        self,
+        application_id: str,
+        version: str,
+        file_id: str | None,
+        test_channel: bool,
+    ) -> tuple[str, dict[str, Any]]:
+        """Get the pre-signed download URL and file metadata."""
         url_response = self.get_download_url(
             application_id=application_id,
             version=version,
@@ -176,26 +260,13 @@ class CustomerClient(BaseClient):
             raise Exception(f"Failed to get download URL: {url_response.error}")
 
         data = url_response.data
-        download_url: str = data["url"]
-        expected_checksum: str | None = data.get("checksum")
         metadata: dict[str, Any] = {
             "fileName": data.get("fileName"),
             "fileSize": data.get("fileSize"),
-            "checksum": expected_checksum,
+            "checksum": data.get("checksum"),
             "expiresAt": data.get("expiresAt"),
         }
-
-        content = self.download(download_url)
-
-        if verify_checksum and expected_checksum:
-            actual_checksum = hashlib.sha256(content).hexdigest()
-            if actual_checksum != expected_checksum:
-                raise ValueError(
-                    f"Checksum mismatch: expected {expected_checksum}, "
-                    f"got {actual_checksum}"
-                )
-
-        return content, metadata
+        return data["url"], metadata
 
     def create_share_link(
         self,